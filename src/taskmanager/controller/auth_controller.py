@@ -25,12 +25,12 @@ class Token(BaseModel):
     token_type : str
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_user(create_user_request : UserCreateRequest, db : db_dependency):
+def create_user(create_user_request : UserCreateRequest, db : db_dependency):
     create_user_service(create_user_request, db, bcrypt_contex)
     return {"response": "User Created"}
 
 @router.post("/token", response_model=Token)
-async def login(
+def login(
     form_data : Annotated[OAuth2PasswordRequestForm, Depends()],
     db : db_dependency,
     response : Response
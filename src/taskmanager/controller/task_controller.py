@@ -1,9 +1,10 @@
-from fastapi import APIRouter, status, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
-from src.taskmanager.core import db_dependency, user_dependency
+from src.taskmanager.core import db_dependency, user_dependency, get_current_user
 from src.taskmanager.service import (
     get_task_service,
     get_all_task_service,
@@ -12,7 +13,13 @@ from src.taskmanager.service import (
     update_task_service
 )
 
-router = APIRouter(prefix="/taskmanager", tags=["taskmanager"])
+# Every task route requires auth; FastAPI caches get_current_user per request,
+# so endpoints that also take user_dependency reuse the same result.
+router = APIRouter(
+    prefix="/taskmanager",
+    tags=["taskmanager"],
+    dependencies=[Depends(get_current_user)]
+)
 
 # ---------- SCHEMAS ----------
 class TaskBase(BaseModel):
@@ -28,29 +35,48 @@ class TaskCreate(TaskBase):
 
 class TaskUpdate(TaskBase):
     pass   
-# ---------- ROUTES ----------
 
-@router.get("/{task_id}")
-def get_task(db: db_dependency, user: user_dependency, task_id: int):
-    return get_task_service(db, user["id"], task_id)
+class TaskResponse(TaskBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    created_date: Optional[datetime] = None
+
+class MessageResponse(BaseModel):
+    message: str
 
+# ---------- SERIALIZATION ----------
+# NDJSON for streamed task lists: one chunk per yield_per batch, lines built
+# from TaskResponse so they match the single-task endpoints
+def _serialize(tasks):
+    for batch in tasks.partitions():
+        yield "".join(TaskResponse.model_validate(task).model_dump_json() + "\n" for task in batch)
 
+# ---------- ROUTES ----------
+
+# Registered before /{task_id} so "tasks" isn't parsed as a task id
 @router.get("/tasks")
-def get_tasks(db: db_dependency, user: user_dependency):
-    return get_all_task_service(db, user["id"])
+def get_tasks(db: db_dependency, user: user_dependency) -> StreamingResponse:
+    return StreamingResponse(_serialize(get_all_task_service(db, user)), media_type="application/x-ndjson")
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+def get_task(db: db_dependency, user: user_dependency, task_id: int):
+    return get_task_service(db, user, task_id)
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=TaskResponse)
 def create_task(db: db_dependency, user: user_dependency, task:TaskCreate):
-    return create_task_service(db, user["id"], task)
+    return create_task_service(db, user, task)
 
-@router.patch("/{task_id}")
+@router.patch("/{task_id}", response_model=TaskResponse)
 def update_task(db: db_dependency, user: user_dependency, task_id: int, task:TaskUpdate):
-    return update_task_service(db, user["id"], task_id, task)
+    return update_task_service(db, user, task_id, task)
 
-@router.put("/{task_id}")
+@router.put("/{task_id}", response_model=TaskResponse)
 def update_task_put(db: db_dependency, user: user_dependency, task_id: int, task:TaskUpdate):
-    return update_task_service(db, user["id"], task_id, task)
+    return update_task_service(db, user, task_id, task)
 
-@router.delete("/{task_id}")
+@router.delete("/{task_id}", response_model=MessageResponse)
 def delete_task(db: db_dependency, user: user_dependency, task_id: int):
-    return delete_task_service(db, user["id"], task_id)
\ No newline at end of file
+    return delete_task_service(db, user, task_id)
\ No newline at end of file
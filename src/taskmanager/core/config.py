@@ -1,34 +1,73 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    # Server
+    HOST: str
+    PORT: int
+
+    # App Metadata
+    APP_NAME: str
+    APP_VERSION: str
+    APP_DESCRIPTION: str
+
+    # Environment
+    ENVIRONMENT: str
+    DEBUG: bool
+    THREADPOOL_SIZE: int | None
+
+    # CORS
+    FRONTEND_URL: str
+
+    # Database
+    DATABASE_URL: str | None
+    DB_POOL_SIZE: int
+    DB_MAX_OVERFLOW: int
+    DB_POOL_RECYCLE: int
+
+    # Auth
+    AUTH_SECRET_KEY: str | None
+    AUTH_ALGORITHM: str
+    PASSWORD_CONTEXT_WARMUP: bool
+
 def get_settings():
-    return {
+    return Settings(
          # Server
-        "HOST": os.getenv("HOST", "127.0.0.1"),
-        "PORT": int(os.getenv("PORT", 8000)),
+        HOST=os.getenv("HOST", "127.0.0.1"),
+        PORT=int(os.getenv("PORT", 8000)),
 
         # App Metadata
-        "APP_NAME": os.getenv("APP_NAME", "Workout Tracker API"),
-        "APP_VERSION": os.getenv("APP_VERSION", "1.0.0"),
-        "APP_DESCRIPTION": os.getenv("APP_DESCRIPTION", "Backend for workout tracking"),
+        APP_NAME=os.getenv("APP_NAME", "Workout Tracker API"),
+        APP_VERSION=os.getenv("APP_VERSION", "1.0.0"),
+        APP_DESCRIPTION=os.getenv("APP_DESCRIPTION", "Backend for workout tracking"),
 
         # Environment
-        "ENVIRONMENT": os.getenv("ENVIRONMENT", "development"),
-        "DEBUG": os.getenv("DEBUG", "false").lower() == "true",
+        ENVIRONMENT=os.getenv("ENVIRONMENT", "development"),
+        DEBUG=os.getenv("DEBUG", "false").lower() == "true",
+        # Unset keeps anyio's default of 40 threads. A thread may be hashing a
+        # password (argon2 allocates 46 MiB) or holding a DB connection, so when
+        # raising it keep it within DB_POOL_SIZE + DB_MAX_OVERFLOW and worker memory.
+        THREADPOOL_SIZE=int(os.getenv("THREADPOOL_SIZE")) if os.getenv("THREADPOOL_SIZE") else None,
 
         # CORS
-        "FRONTEND_URL": os.getenv("FRONTEND_URL", "http://localhost:3000"),
+        FRONTEND_URL=os.getenv("FRONTEND_URL", "http://localhost:3000"),
 
         # Database
-        "DATABASE_URL": os.getenv("DATABASE_URL"),
+        DATABASE_URL=os.getenv("DATABASE_URL"),
+        DB_POOL_SIZE=int(os.getenv("DB_POOL_SIZE", 20)),
+        DB_MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", 40)),
+        DB_POOL_RECYCLE=int(os.getenv("DB_POOL_RECYCLE", 1800)),
 
         # Auth
-        "AUTH_SECRET_KEY": os.getenv("AUTH_SECRET_KEY"),
-        "AUTH_ALGORITHM": os.getenv("AUTH_ALGORITHM", "HS256"),
-    }
+        AUTH_SECRET_KEY=os.getenv("AUTH_SECRET_KEY"),
+        AUTH_ALGORITHM=os.getenv("AUTH_ALGORITHM", "HS256"),
+        PASSWORD_CONTEXT_WARMUP=os.getenv("PASSWORD_CONTEXT_WARMUP", "true").lower() == "true",
+    )
 
-# Export settings dictionary
-settings = get_settings()
\ No newline at end of file
+# Export settings, resolved once at import
+settings = get_settings()
@@ -1,11 +1,19 @@
+import hashlib
+import time
 from typing import Annotated
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from fastapi import Depends, HTTPException, status, Request
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 from src.taskmanager.database import SessionLocal
 from src.taskmanager.core import settings
 
+# Bound once at import; read on every authenticated request
+_SECRET = settings.AUTH_SECRET_KEY
+_ALGORITHMS = (settings.AUTH_ALGORITHM,)
+
 # DB Dependency
 def get_db():
     db = SessionLocal()
@@ -16,8 +24,25 @@ def get_db():
 
 db_dependency = Annotated[Session, Depends(get_db)]
 
-# Bcrypt password context
-bcrypt_contex = CryptContext(schemes=["bcrypt"], deprecated = "auto")
+# Password context: new hashes use argon2id, legacy bcrypt hashes still verify
+bcrypt_contex = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=46 * 1024,
+    argon2__time_cost=1,
+    argon2__parallelism=1
+)
+
+# Resolve hash backends at import so the first login in each worker doesn't pay for it.
+# A missing or broken backend raises here and stops the worker from booting.
+if settings.PASSWORD_CONTEXT_WARMUP:
+    for scheme in bcrypt_contex.schemes():
+        bcrypt_contex.handler(scheme).get_backend()
+    bcrypt_contex.hash("warmup")
+
+# Decoded JWT cache: sha256(token) -> (user_id, exp). Only valid tokens are stored.
+_jwt_cache = TTLCache(maxsize=10000, ttl=60)
 
 # Get current user from JWT in cookies
 async def get_current_user(request : Request):
@@ -27,9 +52,17 @@ async def get_current_user(request : Request):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token not found in cookies"
         )
-    
+
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp is None or exp > time.time():
+            return user_id
+        _jwt_cache.pop(key, None)
+
     try:
-        payload = jwt.decode(token, settings["AUTH_SECRET_KEY"], algorithms=[settings["AUTH_ALGORITHM"]])
+        payload = jwt.decode(token, _SECRET, algorithms=_ALGORITHMS)
         email = payload.get("sub")
         user_id = payload.get("id")
         if email is None or user_id is None:
@@ -37,7 +70,8 @@ async def get_current_user(request : Request):
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload"
             )
-        return {"email": email, "id": user_id}
+        _jwt_cache[key] = (user_id, payload.get("exp"))
+        return user_id
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,4 +79,4 @@ async def get_current_user(request : Request):
         )
     
 # Final dependency alias
-user_dependency = Annotated[dict, Depends(get_current_user)]
\ No newline at end of file
+user_dependency = Annotated[int, Depends(get_current_user)]
\ No newline at end of file
@@ -4,7 +4,14 @@ from sqlalchemy .orm import sessionmaker
 from src.taskmanager.core import settings
 
 # Create engine
-engine = create_engine(settings["DATABASE_URL"])
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True
+)
 
 # Create a session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
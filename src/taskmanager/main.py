@@ -1,5 +1,7 @@
 import uvicorn
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from anyio import to_thread
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from taskmanager.core import settings  
 from taskmanager.controller import auth_router, task_router
@@ -8,19 +10,27 @@ from taskmanager.model import User, Task
 
 Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints (password hashing, DB work) run in the anyio threadpool
+    if settings.THREADPOOL_SIZE is not None:
+        to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    yield
+
 # Create FastAPI app instance
 app = FastAPI(
-    title=settings["APP_NAME"],
-    description=settings["APP_DESCRIPTION"],
-    version=settings["APP_VERSION"],
+    title=settings.APP_NAME,
+    description=settings.APP_DESCRIPTION,
+    version=settings.APP_VERSION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[settings["FRONTEND_URL"]], 
+    allow_origins=[settings.FRONTEND_URL], 
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -34,21 +44,23 @@ app.include_router(task_router)
 @app.get("/")
 async def root():
     return {
-        "message": settings["APP_NAME"],
+        "message": settings.APP_NAME,
         "status": "running",
-        "version": settings["APP_VERSION"]
+        "version": settings.APP_VERSION
     }
 
-# Health check
+# Health check (pre-encoded body, no serialization per probe)
+_HEALTH_BODY = b'{"status":"healthy"}'
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Run with uvicorn only when executed directly
 if __name__ == "__main__":
     uvicorn.run(
         "taskmanager.main:app",  
-        host=settings["HOST"],
-        port=settings["PORT"],
-        reload=settings["DEBUG"]
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.DEBUG
     )
@@ -1,9 +1,17 @@
+import threading
 from datetime import datetime, timedelta, timezone
-from jose import jwt
+import jwt
+from cachetools import TTLCache
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from src.taskmanager.model import User
 from src.taskmanager.core import settings
 
+# Login lookup cache: email -> (id, hashed_password).
+# Auth handlers run in the threadpool and TTLCache is not thread-safe.
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
 def create_user_service(create_user_request, db : Session, bcrypt_contex):
     new_user = User(
         email=create_user_request.email,
@@ -11,17 +19,36 @@ def create_user_service(create_user_request, db : Session, bcrypt_contex):
                     )
     db.add(new_user)
     db.commit()
+    with _user_cache_lock:
+        _user_cache.pop(create_user_request.email, None)
 
 def authenticate_user_service(email : str, password : str, db : Session, bcrypt_context):
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        return False
+    with _user_cache_lock:
+        cached = _user_cache.get(email)
+    if cached is not None:
+        user_id, hashed_password = cached
+        user = User(id=user_id, email=email, hashed_password=hashed_password)
+    else:
+        user = db.query(User).filter(User.email == email).first()
+        if not user:
+            return False
+        with _user_cache_lock:
+            _user_cache[email] = (user.id, user.hashed_password)
     if not bcrypt_context.verify(password,user.hashed_password):
         return False
+    # Lazily migrate legacy bcrypt hashes to argon2id on successful login.
+    # Cached users are detached, so write the new hash with an UPDATE.
+    if bcrypt_context.needs_update(user.hashed_password):
+        new_hash = bcrypt_context.hash(password)
+        db.execute(update(User).where(User.id == user.id).values(hashed_password=new_hash))
+        db.commit()
+        user.hashed_password = new_hash
+        with _user_cache_lock:
+            _user_cache[email] = (user.id, new_hash)
     return user
 
 def create_access_token_service(email :str, user_id :int, expire_delta : timedelta):
     expires = datetime.now(timezone.utc) + expire_delta
     encode = {"sub":email, "id":user_id, "exp":expires}
-    return jwt.encode(encode, settings["AUTH_SECRET_KEY"], algorithm=settings["AUTH_ALGORITHM"])
+    return jwt.encode(encode, settings.AUTH_SECRET_KEY, algorithm=settings.AUTH_ALGORITHM)
 
@@ -1,20 +1,24 @@
 from fastapi import HTTPException
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.orm import Session
 from src.taskmanager.model import Task
 
 def get_task_service(db : Session, user_id : int, task_id : int):
-    task = db.query(Task).filter(Task.id == task_id, Task.user_id == user_id).first()
-    if not task:
+    # Primary-key lookup goes through the identity map before hitting the DB
+    task = db.get(Task, task_id)
+    if task is None or task.user_id != user_id:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
 def get_all_task_service(db:Session, user_id : int):
-    return db.query(Task).filter(Task.user_id == user_id).all()
+    # Stream rows in batches (server-side cursor on PostgreSQL) instead of loading them all
+    stmt = select(Task).where(Task.user_id == user_id).execution_options(yield_per=200)
+    return db.execute(stmt).scalars()
 
 
 def create_task_service(db : Session, user_id : int, task):
-    newtask = Task(
+    stmt = insert(Task).values(
         user_id = user_id,
         title = task.title,
         description = task.description,
@@ -22,33 +26,35 @@ def create_task_service(db : Session, user_id : int, task):
         priority = task.priority,
         is_completed = task.is_completed,
         due_date = task.due_date
-    )
-    db.add(newtask)
+    ).returning(Task)
+    newtask = db.execute(stmt).scalar_one()
+    # Detach the RETURNING row so commit doesn't expire it and force a reload
+    db.expunge(newtask)
     db.commit()
-    db.refresh(newtask)
     return newtask
 
 
 def update_task_service(db : Session, user_id : int, task_id : int, task_data):
-    task = db.query(Task).filter(Task.id == task_id, Task.user_id == user_id).first()
+    stmt = update(Task).where(Task.user_id == user_id, Task.id == task_id).values(
+        title = task_data.title,
+        description = task_data.description,
+        category = task_data.category,
+        priority = task_data.priority,
+        is_completed = task_data.is_completed,
+        due_date = task_data.due_date
+    ).returning(Task)
+    task = db.execute(stmt).scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    task.title = task_data.title
-    task.description = task_data.description
-    task.category = task_data.category
-    task.priority = task_data.priority
-    task.is_completed = task_data.is_completed
-    task.due_date = task_data.due_date
-    
+    db.expunge(task)
     db.commit()
-    db.refresh(task)
     return task
 
 
 def delete_task_service(db : Session, user_id : int, task_id : int):
-    workout = db.query(Task).filter(Task.id == task_id, Task.user_id == user_id).first()
-    if not workout:
+    stmt = delete(Task).where(Task.user_id == user_id, Task.id == task_id)
+    result = db.execute(stmt)
+    if result.rowcount == 0:
         raise HTTPException(status_code = 404, detail = "Task not found")
-    db.delete(workout)
     db.commit()
-    return {"message" : "Task delete successfully" }
\ No newline at end of file
+    return {"message" : "Task delete successfully" }
@@ -0,0 +1,54 @@
+from passlib.context import CryptContext
+from sqlalchemy import event, select
+
+from src.taskmanager.model import User
+from src.taskmanager.service import auth_service
+
+
+def _login(client, email, password):
+    return client.post("/auth/token", data={"username": email, "password": password})
+
+
+def test_login_rehashes_bcrypt_to_argon2(client, session_factory):
+    legacy = CryptContext(schemes=["bcrypt"]).hash("secret")
+    with session_factory() as db:
+        db.add(User(email="legacy@example.com", hashed_password=legacy))
+        db.commit()
+
+    response = _login(client, "legacy@example.com", "secret")
+
+    assert response.status_code == 200
+    with session_factory() as db:
+        stored = db.execute(select(User.hashed_password).where(User.email == "legacy@example.com")).scalar_one()
+    assert stored.startswith("$argon2id$")
+    assert _login(client, "legacy@example.com", "secret").status_code == 200
+
+
+def test_login_uses_user_cache(client, engine):
+    assert client.post("/auth/", json={"email": "cached@example.com", "password": "secret"}).status_code == 201
+    assert _login(client, "cached@example.com", "secret").status_code == 200
+    assert "cached@example.com" in auth_service._user_cache
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = _login(client, "cached@example.com", "secret")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert statements == []
+
+
+def test_login_with_cached_user_rejects_wrong_password(client):
+    client.post("/auth/", json={"email": "cached@example.com", "password": "secret"})
+    _login(client, "cached@example.com", "secret")
+
+    response = _login(client, "cached@example.com", "wrong")
+
+    assert response.status_code == 401
@@ -0,0 +1,152 @@
+import json
+
+import pytest
+
+from src.taskmanager.controller.task_controller import _serialize
+from src.taskmanager.model import Task
+from src.taskmanager.service import get_all_task_service
+
+
+def _task(user_id, title):
+    return Task(user_id=user_id, title=title, category="work", priority="low")
+
+
+def test_get_tasks_streams_user_tasks_as_ndjson(auth_client, user, session_factory):
+    with session_factory() as db:
+        db.add_all([_task(user.id, "first"), _task(user.id, "second"), _task(user.id + 1, "other user")])
+        db.commit()
+
+    response = auth_client.get("/taskmanager/tasks")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    tasks = [json.loads(line) for line in response.text.splitlines()]
+    assert [task["title"] for task in tasks] == ["first", "second"]
+    assert all(task["user_id"] == user.id for task in tasks)
+
+
+def test_get_tasks_without_tasks_returns_empty_body(auth_client):
+    response = auth_client.get("/taskmanager/tasks")
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+
+def test_get_tasks_lines_match_single_task_response(auth_client, user, session_factory):
+    with session_factory() as db:
+        task = _task(user.id, "first")
+        db.add(task)
+        db.commit()
+        task_id = task.id
+
+    listed = json.loads(auth_client.get("/taskmanager/tasks").text.splitlines()[0])
+
+    assert listed == auth_client.get(f"/taskmanager/{task_id}").json()
+
+
+def test_serialize_yields_one_chunk_per_batch(user, session_factory):
+    with session_factory() as db:
+        db.add_all([_task(user.id, f"task {i}") for i in range(450)])
+        db.commit()
+
+        chunks = list(_serialize(get_all_task_service(db, user.id)))
+
+    assert [chunk.count("\n") for chunk in chunks] == [200, 200, 50]
+
+def test_get_task_by_id_still_resolves(auth_client, user, session_factory):
+    with session_factory() as db:
+        task = _task(user.id, "first")
+        db.add(task)
+        db.commit()
+        task_id = task.id
+
+    response = auth_client.get(f"/taskmanager/{task_id}")
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "first"
+
+
+
+def test_get_other_users_task_returns_404(auth_client, user, session_factory):
+    with session_factory() as db:
+        task = _task(user.id + 1, "not yours")
+        db.add(task)
+        db.commit()
+        task_id = task.id
+
+    response = auth_client.get(f"/taskmanager/{task_id}")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Task not found"
+
+
+TASK_BODY = {"title": "write tests", "category": "work", "priority": "high"}
+
+
+def _add_task(session_factory, user_id, title):
+    with session_factory() as db:
+        task = _task(user_id, title)
+        db.add(task)
+        db.commit()
+        return task.id
+
+
+def _stored_title(session_factory, task_id):
+    with session_factory() as db:
+        task = db.get(Task, task_id)
+        return task.title if task else None
+
+
+def test_create_task_returns_created_row(auth_client, user, session_factory):
+    response = auth_client.post("/taskmanager/", json=TASK_BODY)
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["id"] is not None
+    assert body["created_date"] is not None
+    assert body["user_id"] == user.id
+    assert body["title"] == "write tests"
+    assert _stored_title(session_factory, body["id"]) == "write tests"
+
+
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_update_task_returns_updated_row(auth_client, user, session_factory, method):
+    task_id = _add_task(session_factory, user.id, "first")
+
+    response = getattr(auth_client, method)(f"/taskmanager/{task_id}", json={**TASK_BODY, "is_completed": True})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == task_id
+    assert body["title"] == "write tests"
+    assert body["is_completed"] is True
+    assert _stored_title(session_factory, task_id) == "write tests"
+
+
+def test_update_other_users_task_returns_404(auth_client, user, session_factory):
+    task_id = _add_task(session_factory, user.id + 1, "not yours")
+
+    response = auth_client.put(f"/taskmanager/{task_id}", json=TASK_BODY)
+
+    assert response.status_code == 404
+    assert _stored_title(session_factory, task_id) == "not yours"
+
+
+def test_delete_other_users_task_returns_404(auth_client, user, session_factory):
+    task_id = _add_task(session_factory, user.id + 1, "not yours")
+
+    response = auth_client.delete(f"/taskmanager/{task_id}")
+
+    assert response.status_code == 404
+    assert _stored_title(session_factory, task_id) == "not yours"
+
+
+def test_delete_task_twice_returns_404(auth_client, user, session_factory):
+    task_id = _add_task(session_factory, user.id, "first")
+
+    assert auth_client.delete(f"/taskmanager/{task_id}").status_code == 200
+    response = auth_client.delete(f"/taskmanager/{task_id}")
+
+    assert response.status_code == 404
+    assert _stored_title(session_factory, task_id) is None
@@ -0,0 +1,41 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from src.taskmanager.core import deps
+from src.taskmanager.service import create_access_token_service
+
+
+def _cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def test_valid_token_is_cached(auth_client, user):
+    response = auth_client.get("/taskmanager/1")
+
+    assert response.status_code == 404
+    token = auth_client.cookies.get("jwt")
+    user_id, exp = deps._jwt_cache[_cache_key(token)]
+    assert user_id == user.id
+    assert exp > time.time()
+
+
+def test_invalid_token_is_not_cached(client):
+    client.cookies.set("jwt", "not-a-jwt")
+
+    response = client.get("/taskmanager/1")
+
+    assert response.status_code == 401
+    assert len(deps._jwt_cache) == 0
+
+
+def test_cached_token_past_exp_is_rejected(client, user):
+    token = create_access_token_service(user.email, user.id, timedelta(seconds=-10))
+    deps._jwt_cache[_cache_key(token)] = (user.id, time.time() - 10)
+    client.cookies.set("jwt", token)
+
+    response = client.get("/taskmanager/1")
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid or expired token"
+    assert _cache_key(token) not in deps._jwt_cache